@@ -7,8 +7,11 @@ Background process for continuous Reddit monitoring
 
 import os
 import sys
+import select
 import signal
+import socket
 import time
+from datetime import datetime
 from pathlib import Path
 
 def get_project_root():
@@ -34,40 +37,88 @@ class BackgroundMonitor:
     
     def __init__(self):
         self.project_root = setup_environment()
-        self.running = True
+        # Set by the signal handler; waits notice it through the wakeup socket
+        self._stop_signal = None
+        # Reused across checks so the HTTP session and parsed state persist
+        self._monitor = None
+        self._monitor_settings = None
         
-        # Import after setting up environment
+        # Import after setting up environment; RedditMonitor (requests, bs4) is
+        # imported lazily in create_monitor_instance so --status/--stop stay fast
         from src.core.config_manager import ConfigManager
-        from src.core.reddit_monitor import RedditMonitor
         from src.utils.logger import get_logger
         
-        self.config_manager = ConfigManager()
+        # Long-lived process: coalesce check-time writes, flushed on shutdown
+        self.config_manager = ConfigManager(save_throttle_seconds=30)
         self.logger = get_logger("background_monitor", log_dir="logs")
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
+        # The interpreter writes a byte here when a signal arrives, which wakes
+        # _sleep's select without any work in the handler itself
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._wakeup_reader.setblocking(False)
+        self._wakeup_writer.setblocking(False)
+        signal.set_wakeup_fd(self._wakeup_writer.fileno())
+        
         self.logger.info("Background monitor initialized")
     
     def signal_handler(self, signum, frame):
         """Handle shutdown signals"""
-        self.logger.info(f"Received signal {signum}, shutting down gracefully...")
-        self.running = False
+        # Only assign a flag: logging, Event.set and Thread.start all take
+        # non-reentrant locks that the interrupted code (or an earlier signal) may hold
+        self._stop_signal = signum
     
-    def create_monitor_instance(self):
+    def create_monitor_instance(self, view=None):
         """Create a Reddit monitor instance with current config"""
         from src.core.reddit_monitor import RedditMonitor
         
-        config = self.config_manager.get_monitor_config()
+        view = view or self.config_manager.get_monitor_view()
         
         return RedditMonitor(
-            url=config.get('url', 'https://www.reddit.com/r/CNC/'),
-            interval=config.get('interval_minutes', 5) * 60,
-            data_dir=config.get('data_directory', 'data'),
+            url=view.url,
+            interval=view.interval_seconds,
+            data_dir=view.data_directory,
             config_manager=self.config_manager
         )
     
+    def get_monitor_instance(self, view):
+        """Return the cached monitor, rebuilding it only when its settings change"""
+        settings = (view.url, view.interval_seconds, view.data_directory)
+        if self._monitor is None or settings != self._monitor_settings:
+            if self._monitor is not None:
+                self._monitor.close()
+            self._monitor = self.create_monitor_instance(view)
+            self._monitor_settings = settings
+        return self._monitor
+    
+    def _sleep(self, seconds):
+        """Block until the timeout; return True as soon as a shutdown signal arrives"""
+        deadline = time.monotonic() + seconds
+        while self._stop_signal is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([self._wakeup_reader], [], [], remaining)
+            if readable:
+                try:
+                    self._wakeup_reader.recv(64)
+                except OSError:
+                    pass
+        return True
+    
+    def wait(self, seconds):
+        """Sleep until shutdown or timeout, writing deferred config changes once due"""
+        flush_in = self.config_manager.get_flush_delay()
+        if flush_in is not None and flush_in < seconds:
+            if self._sleep(flush_in):
+                return
+            self.config_manager.flush()
+            seconds -= flush_in
+        self._sleep(seconds)
+    
     def run(self):
         """Main monitoring loop"""
         self.logger.info("Starting background monitoring service")
@@ -76,15 +127,19 @@ class BackgroundMonitor:
         self.config_manager.start_session()
         
         try:
-            while self.running:
+            while self._stop_signal is None:
+                # Take one snapshot per pass rather than re-reading settings per decision
+                view = self.config_manager.get_monitor_view()
+                now = datetime.now()
+                
                 # Check if monitoring is enabled
-                if not self.config_manager.get_monitor_config().get('enabled', False):
+                if not view.enabled:
                     self.logger.info("Monitoring disabled, stopping background service")
                     break
                 
                 # Check if it's time to monitor
-                if self.config_manager.should_check_now():
-                    monitor = self.create_monitor_instance()
+                if view.is_due(now):
+                    monitor = self.get_monitor_instance(view)
                     
                     self.logger.info("Performing scheduled check...")
                     success = monitor.monitor_once()
@@ -94,28 +149,33 @@ class BackgroundMonitor:
                     else:
                         self.logger.warning("Check failed")
                     
-                    # Calculate wait time until next check
-                    wait_time = self.config_manager.get_time_until_next_check()
+                    # Calculate wait time until next check from the post-check state
+                    view = self.config_manager.get_monitor_view()
+                    wait_time = view.seconds_until_next_check(datetime.now())
                     if wait_time <= 0:
-                        wait_time = self.config_manager.get_interval_seconds()
+                        wait_time = view.interval_seconds
                     
-                    self.logger.info(f"Next check in {wait_time} seconds")
+                    self.logger.info("Next check in %s seconds", wait_time)
                     
-                    # Wait with periodic checks for shutdown signal
-                    start_wait = time.time()
-                    while self.running and (time.time() - start_wait) < wait_time:
-                        time.sleep(min(10, wait_time))  # Check every 10 seconds or remaining time
+                    self.wait(wait_time)
                 else:
-                    # Not time yet, check again in 30 seconds
-                    time.sleep(30)
+                    # Not time yet: sleep until the scheduled check unless asked to stop
+                    self.wait(max(1, view.seconds_until_next_check(now)))
                     
         except Exception as e:
-            self.logger.error(f"Error in monitoring loop: {e}")
+            self.logger.error("Error in monitoring loop: %s", e)
             raise
         finally:
+            if self._stop_signal is not None:
+                self.logger.info("Received signal %s, shutting down gracefully...", self._stop_signal)
+            
             # Clean shutdown
+            if self._monitor is not None:
+                self._monitor.close()
+                self._monitor = None
             self.config_manager.end_session()
             self.config_manager.update_monitor_config({'enabled': False})
+            self.config_manager.flush()
             self.logger.info("Background monitoring service stopped")
     
     def status(self):
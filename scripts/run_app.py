@@ -5,6 +5,7 @@ Reddit Monitor - Streamlit Application Launcher
 Launch script for the Reddit online count monitoring system
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -46,10 +47,9 @@ def check_dependencies():
     
     missing_packages = []
     
+    # find_spec only locates the package, so the heavy imports stay in the Streamlit process
     for import_name, package_name in required_packages:
-        try:
-            __import__(import_name)
-        except ImportError:
+        if importlib.util.find_spec(import_name) is None:
             missing_packages.append(package_name)
     
     if missing_packages:
@@ -1,59 +1,237 @@
+import atexit
+import copy
 import json
 import os
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Read-only so the shared entries can be handed out without copying
+_PREDEFINED_URLS = tuple(MappingProxyType(item) for item in [
+    {
+        "name": "Reddit - CNC",
+        "url": "https://www.reddit.com/r/CNC/",
+        "description": "CNC加工和数控机床讨论"
+    },
+    {
+        "name": "Reddit - 3D打印",
+        "url": "https://www.reddit.com/r/3Dprinting/",
+        "description": "3D打印技术和项目"
+    },
+    {
+        "name": "Reddit - 编程",
+        "url": "https://www.reddit.com/r/programming/",
+        "description": "编程技术讨论"
+    },
+    {
+        "name": "Reddit - 技术",
+        "url": "https://www.reddit.com/r/technology/",
+        "description": "科技新闻和讨论"
+    },
+    {
+        "name": "Reddit - Python",
+        "url": "https://www.reddit.com/r/Python/",
+        "description": "Python编程语言"
+    },
+    {
+        "name": "Reddit - 机器学习",
+        "url": "https://www.reddit.com/r/MachineLearning/",
+        "description": "机器学习和人工智能"
+    }
+])
+
+# Shared defaults; always deep-copied so instances never mutate the template
+_DEFAULT_CONFIG_TEMPLATE = {
+    "monitor": {
+        "url": "https://www.reddit.com/r/CNC/",
+        "interval_minutes": 10,
+        "data_directory": "data",
+        "enabled": False,
+        "last_check_time": None,
+        "last_successful_check": None,
+        "next_scheduled_check": None,
+        "total_checks": 0,
+        "failed_checks": 0,
+        "continuous_mode": True,
+        "max_response_kb": 0
+    },
+    "notifications": {
+        "enable_changes": True,
+        "enable_errors": True
+    },
+    "storage": {
+        "max_files": 100,
+        "auto_cleanup": True
+    },
+    "session": {
+        "start_time": None,
+        "end_time": None,
+        "session_duration": 0,
+        "checks_this_session": 0
+    },
+    "created_at": None,
+    "last_modified": None
+}
+
+class _ReadOnlyMapping(Mapping):
+    """Live read-only view of a nested dict; nested dicts are wrapped on access"""
+    __slots__ = ('_data',)
+    
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if isinstance(value, dict):
+            return _ReadOnlyMapping(value)
+        return value
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+class MonitorView(NamedTuple):
+    """Immutable snapshot of the monitor settings used by scheduling loops"""
+    enabled: bool
+    url: str
+    interval_seconds: float
+    data_directory: str
+    continuous_mode: bool
+    next_check_dt: Optional[datetime]
+    
+    def is_due(self, now: datetime) -> bool:
+        """Whether a check should run at the given time"""
+        if not self.continuous_mode:
+            return True
+        return self.next_check_dt is None or now >= self.next_check_dt
+    
+    def seconds_until_next_check(self, now: datetime) -> int:
+        """Whole seconds from the given time until the next scheduled check"""
+        if self.next_check_dt is None:
+            return 0
+        return max(0, int((self.next_check_dt - now).total_seconds()))
 
 class ConfigManager:
     """Configuration manager for Reddit monitoring system"""
     
-    def __init__(self, config_file: str = "config/config.json"):
+    def __init__(self, config_file: str = "config/config.json", save_throttle_seconds: float = 0):
         self.config_file = config_file
-        self.default_config = {
-            "monitor": {
-                "url": "https://www.reddit.com/r/CNC/",
-                "interval_minutes": 10,
-                "data_directory": "data",
-                "enabled": False,
-                "last_check_time": None,
-                "last_successful_check": None,
-                "next_scheduled_check": None,
-                "total_checks": 0,
-                "failed_checks": 0,
-                "continuous_mode": True
-            },
-            "notifications": {
-                "enable_changes": True,
-                "enable_errors": True
-            },
-            "storage": {
-                "max_files": 100,
-                "auto_cleanup": True
-            },
-            "session": {
-                "start_time": None,
-                "end_time": None,
-                "session_duration": 0,
-                "checks_this_session": 0
-            },
-            "created_at": datetime.now().isoformat(),
-            "last_modified": datetime.now().isoformat()
-        }
+        # Minimum spacing between check-time writes; 0 keeps every write immediate
+        self.save_throttle_seconds = save_throttle_seconds
+        self._dirty = False
+        # The file was just read, so count loading as a save: writes made right after
+        # startup (session start, first check) then share one throttle window
+        self._last_save = time.monotonic()
+        self._flush_registered = False
+        self._validated_key = None
+        self._validated_errors = []
+        # Copy of the last written content (ignoring last_modified), to skip no-op saves
+        self._saved_content: Optional[Dict[str, Any]] = None
+        self._monitor_view: Optional[MonitorView] = None
         self.config = self.load_config()
+        self._bind_sections()
+    
+    @property
+    def default_config(self) -> Dict[str, Any]:
+        """Fresh copy of the default configuration"""
+        return self._new_default_config()
+    
+    @staticmethod
+    def _new_default_config() -> Dict[str, Any]:
+        """Build an independent default configuration stamped with the current time"""
+        config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+        now = datetime.now().isoformat()
+        config['created_at'] = now
+        config['last_modified'] = now
+        return config
+    
+    def _bind_sections(self) -> None:
+        """Cache a direct reference to the monitor section for hot getters"""
+        self._monitor = self.config.setdefault('monitor', {})
+        self._config_view = _ReadOnlyMapping(self.config)
+        
+        # Pre-parse scheduling values so polling loops avoid per-tick conversions
+        # Hand-edited values may be null or strings; validate_config reports them
+        self._interval_seconds = self._to_float(self._monitor.get('interval_minutes'), 10) * 60
+        self._next_check_dt = self._parse_timestamp(self._monitor.get('next_scheduled_check'))
+        self._update_success_rate()
+        self._invalidate_view()
+    
+    @staticmethod
+    def _to_int(value: Any, default: int) -> int:
+        """Coerce a stored number to int, falling back to the default when invalid"""
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return default
+    
+    @staticmethod
+    def _to_float(value: Any, default: float) -> float:
+        """Coerce a stored number to float, keeping fractions and falling back when invalid"""
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return default
+    
+    def _update_success_rate(self) -> None:
+        """Recompute the cached success rate from the check counters"""
+        total = self._to_int(self._monitor.get('total_checks'), 0)
+        failed = self._to_int(self._monitor.get('failed_checks'), 0)
+        self._success_rate = ((total - failed) / total) * 100 if total > 0 else 0.0
+    
+    def _invalidate_view(self) -> None:
+        """Drop the memoized monitor view after a change"""
+        self._monitor_view = None
+    
+    def get_monitor_view(self) -> MonitorView:
+        """Get a memoized read-only view of the monitor settings"""
+        if self._monitor_view is None:
+            monitor = self._monitor
+            self._monitor_view = MonitorView(
+                enabled=bool(monitor.get('enabled', False)),
+                url=monitor.get('url', 'https://www.reddit.com/r/CNC/'),
+                interval_seconds=self._interval_seconds,
+                data_directory=monitor.get('data_directory', 'data'),
+                continuous_mode=monitor.get('continuous_mode', True),
+                next_check_dt=self._next_check_dt
+            )
+        return self._monitor_view
+    
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        """Parse a stored ISO timestamp, returning None when missing or invalid"""
+        if value:
+            try:
+                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except Exception:
+                return None
+        return None
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                return self._merge_config(self.default_config, config)
+                with open(self.config_file, 'rb') as f:
+                    config = self._deserialize_config(f.read())
+                return self._merge_config(self._new_default_config(), config)
             else:
                 # Ensure config directory exists
                 os.makedirs(os.path.dirname(self.config_file) if os.path.dirname(self.config_file) else ".", exist_ok=True)
-                return self.default_config.copy()
+                return self._new_default_config()
         except Exception as e:
             print(f"Error loading config: {e}")
-            return self.default_config.copy()
+            return self._new_default_config()
     
     def save_config(self) -> bool:
         """Save configuration to file"""
@@ -61,22 +239,80 @@ class ConfigManager:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.config_file) if os.path.dirname(self.config_file) else ".", exist_ok=True)
             
+            # Nothing changed since our last write and the file is still there: skip it
+            content = {key: value for key, value in self.config.items() if key != 'last_modified'}
+            if content == self._saved_content and os.path.exists(self.config_file):
+                self._dirty = False
+                self._last_save = time.monotonic()
+                return True
+            
             self.config['last_modified'] = datetime.now().isoformat()
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            
+            # Write to a temp file and swap it in so a crash never truncates the config
+            tmp_file = f"{self.config_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(self._serialize_config())
+            os.replace(tmp_file, self.config_file)
+            
+            self._saved_content = copy.deepcopy(content)
+            self._dirty = False
+            self._last_save = time.monotonic()
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
             return False
     
-    def get_config(self) -> Dict[str, Any]:
-        """Get current configuration"""
-        return self.config.copy()
+    def _save_throttled(self) -> bool:
+        """Save now, or defer the write until the throttle window has passed"""
+        if time.monotonic() - self._last_save >= self.save_throttle_seconds:
+            return self.save_config()
+        
+        self._dirty = True
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+        return True
+    
+    def flush(self) -> bool:
+        """Write any deferred changes to disk"""
+        if not self._dirty:
+            return True
+        return self.save_config()
+    
+    def get_flush_delay(self) -> Optional[float]:
+        """Seconds until deferred changes may be written, or None when nothing is pending"""
+        if not self._dirty:
+            return None
+        return max(0.0, self.save_throttle_seconds - (time.monotonic() - self._last_save))
+    
+    def _serialize_config(self, config: Optional[Dict[str, Any]] = None) -> bytes:
+        """Serialize configuration to UTF-8 JSON, using orjson when available"""
+        if config is None:
+            config = self.config
+        if orjson is not None:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    @staticmethod
+    def _deserialize_config(data: bytes) -> Dict[str, Any]:
+        """Parse UTF-8 JSON configuration, using orjson when available"""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data.decode('utf-8'))
+    
+    def get_config(self) -> Mapping[str, Any]:
+        """Get a read-only view of the current configuration"""
+        return self._config_view
+    
+    def clone_config(self) -> Dict[str, Any]:
+        """Get an independent deep copy of the configuration for callers that modify it"""
+        return copy.deepcopy(self.config)
     
     def update_config(self, updates: Dict[str, Any]) -> bool:
         """Update configuration with new values"""
         try:
             self.config = self._merge_config(self.config, updates)
+            self._bind_sections()
             return self.save_config()
         except Exception as e:
             print(f"Error updating config: {e}")
@@ -84,11 +320,11 @@ class ConfigManager:
     
     def get_monitor_config(self) -> Dict[str, Any]:
         """Get monitor-specific configuration"""
-        return self.config.get('monitor', {})
+        return self._monitor
     
     def update_monitor_config(self, updates: Dict[str, Any]) -> bool:
         """Update monitor configuration"""
-        monitor_config = self.config.get('monitor', {}).copy()
+        monitor_config = self._monitor.copy()
         
         # Handle both dict and individual parameters
         if isinstance(updates, dict):
@@ -99,160 +335,121 @@ class ConfigManager:
                     monitor_config[key] = value
         
         self.config['monitor'] = monitor_config
+        self._bind_sections()
         return self.save_config()
     
-    def get_interval_seconds(self) -> int:
+    def get_interval_seconds(self) -> float:
         """Get monitoring interval in seconds"""
-        return self.config.get('monitor', {}).get('interval_minutes', 10) * 60
+        return self._interval_seconds
     
     def get_monitor_url(self) -> str:
         """Get monitoring URL"""
-        return self.config.get('monitor', {}).get('url', 'https://www.reddit.com/r/CNC/')
+        return self._monitor.get('url', 'https://www.reddit.com/r/CNC/')
     
     def get_data_directory(self) -> str:
         """Get data directory"""
-        return self.config.get('monitor', {}).get('data_directory', 'data')
+        return self._monitor.get('data_directory', 'data')
     
     def validate_config(self) -> List[str]:
         """Validate configuration values"""
-        errors = []
+        monitor_config = self._monitor
+        url = monitor_config.get('url', '')
+        interval = monitor_config.get('interval_minutes', 0)
+        data_dir = monitor_config.get('data_directory', '')
+        
+        # Settings rarely change between UI refreshes, so reuse the last result
+        key = (url, interval, data_dir)
+        if key == self._validated_key:
+            return list(self._validated_errors)
         
-        monitor_config = self.config.get('monitor', {})
+        errors = []
         
         # Validate URL
-        url = monitor_config.get('url', '')
         if not url or not url.startswith(('http://', 'https://')):
             errors.append("监控URL必须是有效的HTTP/HTTPS地址")
         
         # Validate interval
-        interval = monitor_config.get('interval_minutes', 0)
         if not isinstance(interval, (int, float)) or interval < 1:
             errors.append("监控间隔必须大于0分钟")
         
         # Validate data directory
-        data_dir = monitor_config.get('data_directory', '')
         if not data_dir:
             errors.append("数据目录不能为空")
         
-        return errors
+        self._validated_key = key
+        self._validated_errors = errors
+        return list(errors)
     
     def _merge_config(self, base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
         """Deep merge configuration dictionaries"""
         result = base.copy()
-        for key, value in updates.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_config(result[key], value)
-            else:
-                result[key] = value
+        stack = [(result, updates)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    # Copy only the nested dicts we descend into so base stays untouched
+                    target[key] = current.copy()
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
         return result
     
     def reset_to_defaults(self) -> bool:
         """Reset configuration to defaults"""
-        self.config = self.default_config.copy()
-        self.config['created_at'] = datetime.now().isoformat()
-        self.config['last_modified'] = datetime.now().isoformat()
+        self.config = self._new_default_config()
+        self._bind_sections()
         return self.save_config()
     
-    def get_predefined_urls(self) -> List[Dict[str, str]]:
+    def get_predefined_urls(self) -> Tuple[Mapping[str, str], ...]:
         """Get list of predefined popular URLs"""
-        return [
-            {
-                "name": "Reddit - CNC",
-                "url": "https://www.reddit.com/r/CNC/",
-                "description": "CNC加工和数控机床讨论"
-            },
-            {
-                "name": "Reddit - 3D打印",
-                "url": "https://www.reddit.com/r/3Dprinting/",
-                "description": "3D打印技术和项目"
-            },
-            {
-                "name": "Reddit - 编程",
-                "url": "https://www.reddit.com/r/programming/",
-                "description": "编程技术讨论"
-            },
-            {
-                "name": "Reddit - 技术",
-                "url": "https://www.reddit.com/r/technology/",
-                "description": "科技新闻和讨论"
-            },
-            {
-                "name": "Reddit - Python",
-                "url": "https://www.reddit.com/r/Python/",
-                "description": "Python编程语言"
-            },
-            {
-                "name": "Reddit - 机器学习",
-                "url": "https://www.reddit.com/r/MachineLearning/",
-                "description": "机器学习和人工智能"
-            }
-        ]
+        return _PREDEFINED_URLS
     
     def update_check_time(self, success: bool = True) -> bool:
         """Update the last check time and statistics"""
-        now = datetime.now().isoformat()
-        monitor_config = self.config.get('monitor', {})
+        # Read the clock once and derive every timestamp from it
+        now = datetime.now()
+        now_iso = now.isoformat()
+        monitor_config = self._monitor
         
-        monitor_config['last_check_time'] = now
+        monitor_config['last_check_time'] = now_iso
         if success:
-            monitor_config['last_successful_check'] = now
+            monitor_config['last_successful_check'] = now_iso
         
         monitor_config['total_checks'] = monitor_config.get('total_checks', 0) + 1
         if not success:
             monitor_config['failed_checks'] = monitor_config.get('failed_checks', 0) + 1
+        self._update_success_rate()
         
         # Calculate next scheduled check
-        interval_minutes = monitor_config.get('interval_minutes', 10)
-        next_time = datetime.now() + timedelta(minutes=interval_minutes)
+        next_time = now + timedelta(seconds=self._interval_seconds)
         monitor_config['next_scheduled_check'] = next_time.isoformat()
+        self._next_check_dt = next_time
+        self._invalidate_view()
         
         # Update session stats
         session_config = self.config.get('session', {})
         session_config['checks_this_session'] = session_config.get('checks_this_session', 0) + 1
         
-        self.config['monitor'] = monitor_config
         self.config['session'] = session_config
-        return self.save_config()
+        return self._save_throttled()
     
     def get_last_check_time(self) -> Optional[datetime]:
         """Get the last check time as datetime object"""
-        last_check = self.config.get('monitor', {}).get('last_check_time')
-        if last_check:
-            try:
-                return datetime.fromisoformat(last_check.replace('Z', '+00:00'))
-            except Exception:
-                return None
-        return None
+        return self._parse_timestamp(self._monitor.get('last_check_time'))
     
     def get_next_scheduled_check(self) -> Optional[datetime]:
         """Get the next scheduled check time as datetime object"""
-        next_check = self.config.get('monitor', {}).get('next_scheduled_check')
-        if next_check:
-            try:
-                return datetime.fromisoformat(next_check.replace('Z', '+00:00'))
-            except Exception:
-                return None
-        return None
+        return self._next_check_dt
     
     def should_check_now(self) -> bool:
         """Determine if we should check now based on schedule"""
-        if not self.config.get('monitor', {}).get('continuous_mode', True):
-            return True
-            
-        next_check = self.get_next_scheduled_check()
-        if next_check is None:
-            return True
-            
-        return datetime.now() >= next_check
+        return self.get_monitor_view().is_due(datetime.now())
     
     def get_time_until_next_check(self) -> int:
         """Get seconds until next scheduled check"""
-        next_check = self.get_next_scheduled_check()
-        if next_check is None:
-            return 0
-            
-        delta = next_check - datetime.now()
-        return max(0, int(delta.total_seconds()))
+        return self.get_monitor_view().seconds_until_next_check(datetime.now())
     
     def start_session(self) -> bool:
         """Start a new monitoring session"""
@@ -262,7 +459,7 @@ class ConfigManager:
         session_config['checks_this_session'] = 0
         
         self.config['session'] = session_config
-        return self.save_config()
+        return self._save_throttled()
     
     def end_session(self) -> bool:
         """End the current monitoring session"""
@@ -281,28 +478,23 @@ class ConfigManager:
                 pass
         
         self.config['session'] = session_config
-        return self.save_config()
+        return self._save_throttled()
     
     def get_session_stats(self) -> Dict[str, Any]:
         """Get current session statistics"""
         session = self.config.get('session', {})
-        monitor = self.config.get('monitor', {})
+        monitor = self._monitor
         
         stats = {
             'session_start': session.get('start_time'),
             'session_checks': session.get('checks_this_session', 0),
             'total_checks': monitor.get('total_checks', 0),
             'failed_checks': monitor.get('failed_checks', 0),
-            'success_rate': 0.0,
+            'success_rate': self._success_rate,
             'last_check': monitor.get('last_check_time'),
             'last_successful_check': monitor.get('last_successful_check'),
             'next_check': monitor.get('next_scheduled_check'),
             'time_until_next': self.get_time_until_next_check()
         }
         
-        total = monitor.get('total_checks', 0)
-        if total > 0:
-            failed = monitor.get('failed_checks', 0)
-            stats['success_rate'] = ((total - failed) / total) * 100
-            
         return stats
\ No newline at end of file
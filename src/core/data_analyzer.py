@@ -1,10 +1,54 @@
+import functools
 import json
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from collections import defaultdict
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Text columns that are often entirely empty; fixing their dtype keeps both parsers in step
+_CSV_TEXT_DTYPES = {'subreddit': 'object', 'error': 'object'}
+
+@functools.lru_cache(maxsize=4)
+def _read_monitoring_csv(csv_file: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse the monitoring CSV; keyed on file version so unchanged files parse once"""
+    df = None
+    if pyarrow is not None:
+        # Multithreaded columnar parser; if it rejects the file, the whole file is re-read below
+        try:
+            df = pd.read_csv(csv_file, engine='pyarrow', dtype=_CSV_TEXT_DTYPES)
+        except (pyarrow.ArrowInvalid, ValueError) as e:
+            print(f"pyarrow could not parse {csv_file}, using the default parser: {e}")
+        else:
+            if df.empty:
+                # Header-only file: no rows to infer column types from, so use the C engine
+                df = None
+            else:
+                # pyarrow leaves missing text as None (or '' on older pandas) where the
+                # C engine uses NaN
+                text = df[list(_CSV_TEXT_DTYPES)].replace('', np.nan)
+                df[list(_CSV_TEXT_DTYPES)] = text.where(text.notna(), np.nan)
+    if df is None:
+        df = pd.read_csv(csv_file, dtype=_CSV_TEXT_DTYPES)
+    # Timestamps are written by datetime.isoformat(); an explicit format skips per-row inference.
+    # pyarrow may already have parsed them at a coarser unit, so pin nanoseconds for both parsers
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601').astype('datetime64[ns]')
+    df['online_count'] = pd.to_numeric(df['online_count'], errors='coerce')
+    df['member_count'] = pd.to_numeric(df['member_count'], errors='coerce')
+    return df.dropna(subset=['online_count'])
+
+def load_monitoring_csv(csv_file: str) -> pd.DataFrame:
+    """Load monitoring data, reusing the parsed frame while the file is unchanged"""
+    stat = os.stat(csv_file)
+    # Hand out a copy so callers adding columns never touch the cached frame
+    return _read_monitoring_csv(csv_file, stat.st_mtime_ns, stat.st_size).copy()
+
 class DataAnalyzer:
     """Data analysis utilities for Reddit monitoring data"""
     
@@ -19,11 +63,7 @@ class DataAnalyzer:
             return None
         
         try:
-            df = pd.read_csv(csv_file)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df['online_count'] = pd.to_numeric(df['online_count'], errors='coerce')
-            df['member_count'] = pd.to_numeric(df['member_count'], errors='coerce')
-            return df.dropna(subset=['online_count'])
+            return load_monitoring_csv(csv_file)
         except Exception as e:
             print(f"Error loading CSV data: {e}")
             return None
@@ -89,21 +129,25 @@ class DataAnalyzer:
         if df.empty:
             return []
         
-        mean = df['online_count'].mean()
-        std = df['online_count'].std()
-        
-        anomalies = []
-        for _, row in df.iterrows():
-            z_score = abs(row['online_count'] - mean) / std
-            if z_score > threshold:
-                anomalies.append({
-                    'timestamp': row['timestamp'],
-                    'online_count': row['online_count'],
-                    'z_score': z_score,
-                    'type': 'high' if row['online_count'] > mean else 'low'
-                })
-        
-        return anomalies
+        online_counts = df['online_count']
+        mean = online_counts.mean()
+        std = online_counts.std()
+        
+        # Score every row in one vectorized pass, then build dicts only for outliers
+        z_scores = (online_counts - mean).abs() / std
+        mask = z_scores > threshold
+        
+        return [
+            {
+                'timestamp': timestamp,
+                'online_count': count,
+                'z_score': z_score,
+                'type': 'high' if count > mean else 'low'
+            }
+            for timestamp, count, z_score in zip(
+                df['timestamp'][mask], online_counts[mask], z_scores[mask]
+            )
+        ]
     
     def get_growth_metrics(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Calculate growth/change metrics"""
@@ -175,48 +219,59 @@ class DataAnalyzer:
             print(f"Error exporting analysis: {e}")
             return None
     
-    def print_summary(self) -> None:
-        """Print a readable summary of the analysis"""
-        report = self.generate_report()
+    def format_summary(self, report: Optional[Dict[str, Any]] = None) -> str:
+        """Format a readable summary of the analysis as a single string"""
+        if report is None:
+            report = self.generate_report()
         
         if "error" in report:
-            print(f"Error: {report['error']}")
-            return
+            return f"Error: {report['error']}"
         
-        print("=== Reddit Monitor Analysis Report ===")
+        lines = ["=== Reddit Monitor Analysis Report ==="]
         
         summary = report['data_summary']
-        print(f"\n📊 Data Summary:")
-        print(f"  Total records: {summary['total_records']}")
-        print(f"  Time range: {summary['time_range']['start']} to {summary['time_range']['end']}")
-        print(f"  Duration: {summary['time_range']['duration']}")
-        print(f"  Success rate: {summary['success_rate']:.1f}%")
+        lines.append("")
+        lines.append(f"📊 Data Summary:")
+        lines.append(f"  Total records: {summary['total_records']}")
+        lines.append(f"  Time range: {summary['time_range']['start']} to {summary['time_range']['end']}")
+        lines.append(f"  Duration: {summary['time_range']['duration']}")
+        lines.append(f"  Success rate: {summary['success_rate']:.1f}%")
         
         online_stats = summary['online_count_stats']
-        print(f"\n👥 Online Count Statistics:")
-        print(f"  Average: {online_stats['mean']:.1f}")
-        print(f"  Median: {online_stats['median']:.1f}")
-        print(f"  Min: {online_stats['min']:.0f}")
-        print(f"  Max: {online_stats['max']:.0f}")
-        print(f"  Standard deviation: {online_stats['std']:.1f}")
+        lines.append("")
+        lines.append(f"👥 Online Count Statistics:")
+        lines.append(f"  Average: {online_stats['mean']:.1f}")
+        lines.append(f"  Median: {online_stats['median']:.1f}")
+        lines.append(f"  Min: {online_stats['min']:.0f}")
+        lines.append(f"  Max: {online_stats['max']:.0f}")
+        lines.append(f"  Standard deviation: {online_stats['std']:.1f}")
         
         trends = report['trends']
         if 'peak_hour' in trends:
-            print(f"\n📈 Activity Patterns:")
-            print(f"  Peak activity hour: {trends['peak_hour']}:00")
-            print(f"  Lowest activity hour: {trends['lowest_hour']}:00")
+            lines.append("")
+            lines.append(f"📈 Activity Patterns:")
+            lines.append(f"  Peak activity hour: {trends['peak_hour']}:00")
+            lines.append(f"  Lowest activity hour: {trends['lowest_hour']}:00")
         
         growth = report['growth_metrics']
         if growth:
-            print(f"\n📈 Growth Metrics:")
-            print(f"  Total change: {growth['total_change']:+.0f}")
-            print(f"  Average change per measurement: {growth['avg_change_per_measurement']:+.1f}")
-            print(f"  Biggest increase: +{growth['biggest_increase']:.0f}")
-            print(f"  Biggest decrease: {growth['biggest_decrease']:.0f}")
-            print(f"  Significant changes: {growth['significant_changes_count']}")
+            lines.append("")
+            lines.append(f"📈 Growth Metrics:")
+            lines.append(f"  Total change: {growth['total_change']:+.0f}")
+            lines.append(f"  Average change per measurement: {growth['avg_change_per_measurement']:+.1f}")
+            lines.append(f"  Biggest increase: +{growth['biggest_increase']:.0f}")
+            lines.append(f"  Biggest decrease: {growth['biggest_decrease']:.0f}")
+            lines.append(f"  Significant changes: {growth['significant_changes_count']}")
         
         anomalies = report['anomalies']
         if anomalies['count'] > 0:
-            print(f"\n⚠️  Anomalies Detected: {anomalies['count']}")
+            lines.append("")
+            lines.append(f"⚠️  Anomalies Detected: {anomalies['count']}")
             for anomaly in anomalies['details'][:3]:  # Show first 3
-                print(f"  - {anomaly['timestamp']}: {anomaly['online_count']} users (z-score: {anomaly['z_score']:.1f})")
\ No newline at end of file
+                lines.append(f"  - {anomaly['timestamp']}: {anomaly['online_count']} users (z-score: {anomaly['z_score']:.1f})")
+        
+        return "\n".join(lines)
+    
+    def print_summary(self) -> None:
+        """Print a readable summary of the analysis"""
+        print(self.format_summary())
\ No newline at end of file
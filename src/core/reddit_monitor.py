@@ -1,31 +1,115 @@
 import requests
-import time
 import json
 import os
 import csv
 import re
+import threading
 from datetime import datetime
-from hashlib import md5
 import logging
 from typing import Dict, Optional, Any
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config_manager import ConfigManager
 
+# Extraction patterns, compiled once at import and tried in order
+_ONLINE_ATTR_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'active="(\d+)"',
+    r'activeUsers["\']:\s*(\d+)',
+    r'activeUserCount["\']:\s*(\d+)',
+    r'data-active["\']="(\d+)"',
+    r'data-online["\']="(\d+)"'
+))
+
+_ONLINE_TEXT_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?<![\d,.])(\d{1,3}(?:,\d{3})+|\d+)\s+(?:users?\s+)?online',
+    r'(?<![\d,.])(\d{1,3}(?:,\d{3})+|\d+)\s+(?:members?\s+)?online',
+    r'(?<![\d,.])(\d{1,3}(?:,\d{3})+|\d+)\s+currently\s+viewing',
+    r'(?<![\d,.])(\d{1,3}(?:,\d{3})+|\d+)\s+active\s+users?',
+    r'(?<![\d,.])(\d{1,3}(?:,\d{3})+|\d+)\s+here\s+now',
+    r'"activeUserCount"[^:]*:\s*(\d+)',
+    r'"activeUsers"[^:]*:\s*(\d+)'
+))
+
+_MEMBER_ATTR_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'subscribers="(\d+)"',
+    r'subscriberCount["\']:\s*(\d+)',
+    r'memberCount["\']:\s*(\d+)',
+    r'data-subscribers["\']="(\d+)"'
+))
+
+_MEMBER_TEXT_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?<![\d,.])((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?[kKmM]?)\s+(?:members?|subscribers?)',
+    r'(?<![\d,.])((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?[kKmM]?)\s+joined',
+    r'"subscriberCount"[^:]*:\s*(\d+)',
+    r'"subscribers"[^:]*:\s*(\d+)'
+))
+
+_ONLINE_SELECTORS = (
+    '[data-testid="online-count"]',
+    '.online-count',
+    '.active-users',
+    '.subscribers-online'
+)
+
+_SUBREDDIT_RE = re.compile(r'/r/([^/]+)')
+_COUNT_RE = re.compile(r'(?<![\d,.])(\d{1,3}(?:,\d{3})+|\d+)')
+
 class RedditMonitor:
     """Reddit online count monitoring system with intelligent scheduling"""
     
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    CSV_TAIL_BYTES = 4096
+    
     def __init__(self, url: str = "https://www.reddit.com/r/CNC/", 
                  interval: int = 600, data_dir: str = "data", 
                  config_manager: Optional[ConfigManager] = None):
         self.url = url
         self.interval = interval
         self.data_dir = data_dir
+        # Cap on response bytes scanned per fetch; 0 reads the whole page
+        self.max_response_kb = 0
         self.config_manager = config_manager or ConfigManager()
         
         self._load_from_config()
         self.setup_logging()
         self.ensure_data_directory()
+        self.session = self._create_session()
+        
+        # Set by stop() to wake start_monitoring out of its wait immediately
+        self._stop_event = threading.Event()
+        
+        # Online count of the last CSV record, seeded from disk on first use
+        self._last_saved_count: Optional[int] = None
+        self._last_saved_loaded = False
+        
+        # Validators and parsed result of the last full response, for conditional GETs
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+        
+    @property
+    def url(self) -> str:
+        """Monitored subreddit URL"""
+        return self._url
+    
+    @url.setter
+    def url(self, value: str) -> None:
+        self._url = value
+        # Derive the subreddit name here so fetches don't re-run the regex
+        match = _SUBREDDIT_RE.search(value)
+        self._subreddit = match.group(1) if match else 'unknown'
+    
+    @property
+    def data_dir(self) -> str:
+        """Directory holding the monitoring CSV"""
+        return self._data_dir
+    
+    @data_dir.setter
+    def data_dir(self, value: str) -> None:
+        self._data_dir = value
+        self._csv_path = f"{value}/reddit_online_count.csv"
         
     def _load_from_config(self) -> None:
         """Load settings from config manager"""
@@ -37,6 +121,8 @@ class RedditMonitor:
                 self.interval = monitor_config['interval_minutes'] * 60
             if monitor_config.get('data_directory'):
                 self.data_dir = monitor_config['data_directory']
+            if monitor_config.get('max_response_kb'):
+                self.max_response_kb = max(0, int(monitor_config['max_response_kb']))
         except Exception as e:
             print(f"Warning: Failed to load config: {e}")
         
@@ -50,6 +136,8 @@ class RedditMonitor:
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
+                # Plain handler: the UI and the background service both append to this file,
+                # and rotation by rename is not safe across processes
                 logging.FileHandler(f'{logs_dir}/reddit_monitor.log'),
                 logging.StreamHandler()
             ]
@@ -59,34 +147,69 @@ class RedditMonitor:
     def ensure_data_directory(self) -> None:
         """Create data directory if it doesn't exist"""
         os.makedirs(self.data_dir, exist_ok=True)
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session so keep-alive connections survive between checks"""
+        session = requests.Session()
+        session.headers['User-Agent'] = self.USER_AGENT
+        
+        # Retry only failed connects, with short backoff: the fetch must stay well inside
+        # the few seconds the UI allows a stopping worker before it kills the process
+        retries = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5,
+                        respect_retry_after_header=False)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def stop(self) -> None:
+        """Ask start_monitoring to exit at its next wait"""
+        self._stop_event.set()
+    
+    def close(self) -> None:
+        """Release pooled HTTP connections"""
+        self.session.close()
             
     def fetch_reddit_online_count(self) -> Dict[str, Any]:
         """Fetch Reddit subreddit online user count"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            headers = {}
+            if self._last_result is not None:
+                if self._etag:
+                    headers['If-None-Match'] = self._etag
+                if self._last_modified:
+                    headers['If-Modified-Since'] = self._last_modified
+            
+            max_bytes = self.max_response_kb * 1024
+            stream = max_bytes > 0
             
             try:
-                response = requests.get(self.url, headers=headers, timeout=30)
+                response = self.session.get(self.url, headers=headers, timeout=30, stream=stream)
             except requests.exceptions.SSLError:
                 self.logger.warning("SSL error, trying without verification...")
-                response = requests.get(self.url, headers=headers, timeout=30, verify=False)
+                response = self.session.get(self.url, headers=headers, timeout=30, stream=stream, verify=False)
             
-            response.raise_for_status()
+            # Page unchanged since the last full response: reuse its parsed counts
+            if response.status_code == 304 and self._last_result is not None:
+                response.close()
+                self.logger.info("Page not modified, reusing previous counts")
+                return dict(self._last_result,
+                            timestamp=datetime.now().isoformat(),
+                            status_code=response.status_code)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if not response.ok:
+                response.close()
+            response.raise_for_status()
             
-            # Extract subreddit name from URL
-            subreddit_match = re.search(r'/r/([^/]+)', self.url)
-            subreddit_name = subreddit_match.group(1) if subreddit_match else 'unknown'
+            html_text = self._read_body(response, max_bytes)
             
-            online_count = self._extract_online_count(soup, response.text)
-            member_count = self._extract_member_count(soup, response.text)
+            # The regex stages usually succeed, so the HTML tree is only built on demand
+            online_count = self._extract_online_count(None, html_text)
+            member_count = self._extract_member_count(None, html_text)
             
-            return {
+            result = {
                 'timestamp': datetime.now().isoformat(),
-                'subreddit': subreddit_name,
+                'subreddit': self._subreddit,
                 'url': self.url,
                 'online_count': online_count,
                 'member_count': member_count,
@@ -94,8 +217,13 @@ class RedditMonitor:
                 'success': True
             }
             
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+            self._last_result = result
+            return result
+            
         except Exception as e:
-            self.logger.error(f"Failed to fetch Reddit data: {e}")
+            self.logger.error("Failed to fetch Reddit data: %s", e)
             return {
                 'timestamp': datetime.now().isoformat(),
                 'subreddit': 'unknown',
@@ -107,19 +235,24 @@ class RedditMonitor:
                 'error': str(e)
             }
     
-    def _extract_online_count(self, soup: BeautifulSoup, html_text: str) -> Optional[int]:
+    @staticmethod
+    def _read_body(response: requests.Response, max_bytes: int) -> str:
+        """Decode the response body once, reading at most max_bytes when a cap is set"""
+        if max_bytes <= 0:
+            return response.text
+        
+        try:
+            raw = response.raw.read(max_bytes, decode_content=True)
+        finally:
+            # Unread remainder can't go back to the pool, so drop this connection
+            response.close()
+        return raw.decode(response.encoding or 'utf-8', errors='replace')
+    
+    def _extract_online_count(self, soup: Optional[BeautifulSoup], html_text: str) -> Optional[int]:
         """Extract online user count from Reddit page"""
         # Method 1: Look for Reddit-specific HTML attributes
-        attribute_patterns = [
-            r'active="(\d+)"',
-            r'activeUsers["\']:\s*(\d+)',
-            r'activeUserCount["\']:\s*(\d+)',
-            r'data-active["\']="(\d+)"',
-            r'data-online["\']="(\d+)"'
-        ]
-        
-        for pattern in attribute_patterns:
-            match = re.search(pattern, html_text, re.IGNORECASE)
+        for regex in _ONLINE_ATTR_RES:
+            match = regex.search(html_text)
             if match:
                 try:
                     return int(match.group(1))
@@ -127,18 +260,8 @@ class RedditMonitor:
                     continue
         
         # Method 2: Look for "online" text patterns
-        online_patterns = [
-            r'(\d{1,3}(?:,\d{3})*)\s+(?:users?\s+)?online',
-            r'(\d{1,3}(?:,\d{3})*)\s+(?:members?\s+)?online',
-            r'(\d{1,3}(?:,\d{3})*)\s+currently\s+viewing',
-            r'(\d{1,3}(?:,\d{3})*)\s+active\s+users?',
-            r'(\d{1,3}(?:,\d{3})*)\s+here\s+now',
-            r'"activeUserCount"[^:]*:\s*(\d+)',
-            r'"activeUsers"[^:]*:\s*(\d+)'
-        ]
-        
-        for pattern in online_patterns:
-            match = re.search(pattern, html_text, re.IGNORECASE)
+        for regex in _ONLINE_TEXT_RES:
+            match = regex.search(html_text)
             if match:
                 count_str = match.group(1).replace(',', '')
                 try:
@@ -146,41 +269,29 @@ class RedditMonitor:
                 except ValueError:
                     continue
         
-        # Method 3: Look in specific HTML elements
-        if soup:
-            selectors = [
-                '[data-testid="online-count"]',
-                '.online-count',
-                '.active-users',
-                '.subscribers-online'
-            ]
-            
-            for selector in selectors:
-                element = soup.select_one(selector)
-                if element:
-                    text = element.get_text()
-                    match = re.search(r'(\d{1,3}(?:,\d{3})*)', text)
-                    if match:
-                        try:
-                            return int(match.group(1).replace(',', ''))
-                        except ValueError:
-                            continue
+        # Method 3: Look in specific HTML elements, parsing the page only now
+        if soup is None:
+            soup = BeautifulSoup(html_text, 'html.parser')
+        
+        for selector in _ONLINE_SELECTORS:
+            element = soup.select_one(selector)
+            if element:
+                text = element.get_text()
+                match = _COUNT_RE.search(text)
+                if match:
+                    try:
+                        return int(match.group(1).replace(',', ''))
+                    except ValueError:
+                        continue
         
         self.logger.warning("Could not extract online count")
         return None
     
-    def _extract_member_count(self, soup: BeautifulSoup, html_text: str) -> Optional[int]:
+    def _extract_member_count(self, soup: Optional[BeautifulSoup], html_text: str) -> Optional[int]:
         """Extract total member count from Reddit page"""
         # Method 1: Look for Reddit-specific HTML attributes
-        attribute_patterns = [
-            r'subscribers="(\d+)"',
-            r'subscriberCount["\']:\s*(\d+)',
-            r'memberCount["\']:\s*(\d+)',
-            r'data-subscribers["\']="(\d+)"'
-        ]
-        
-        for pattern in attribute_patterns:
-            match = re.search(pattern, html_text, re.IGNORECASE)
+        for regex in _MEMBER_ATTR_RES:
+            match = regex.search(html_text)
             if match:
                 try:
                     return int(match.group(1))
@@ -188,15 +299,8 @@ class RedditMonitor:
                     continue
         
         # Method 2: Look for member count patterns with suffixes
-        member_patterns = [
-            r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?[kKmM]?)\s+(?:members?|subscribers?)',
-            r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?[kKmM]?)\s+joined',
-            r'"subscriberCount"[^:]*:\s*(\d+)',
-            r'"subscribers"[^:]*:\s*(\d+)'
-        ]
-        
-        for pattern in member_patterns:
-            match = re.search(pattern, html_text, re.IGNORECASE)
+        for regex in _MEMBER_TEXT_RES:
+            match = regex.search(html_text)
             if match:
                 count_str = match.group(1).replace(',', '')
                 try:
@@ -216,15 +320,15 @@ class RedditMonitor:
         if not data:
             return None
             
-        csv_filename = f"{self.data_dir}/reddit_online_count.csv"
-        file_exists = os.path.exists(csv_filename)
+        csv_filename = self._csv_path
         
         try:
             with open(csv_filename, 'a', newline='', encoding='utf-8') as f:
                 fieldnames = ['timestamp', 'subreddit', 'online_count', 'member_count', 'success', 'error']
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 
-                if not file_exists:
+                # Append mode starts at the end, so an empty file needs the header
+                if f.tell() == 0:
                     writer.writeheader()
                 
                 row_data = {
@@ -237,51 +341,81 @@ class RedditMonitor:
                 }
                 
                 writer.writerow(row_data)
+            
+            self._last_saved_count = self._to_count(row_data['online_count'])
+            self._last_saved_loaded = True
                 
-            self.logger.info(f"Data saved to CSV: {csv_filename}")
+            self.logger.info("Data saved to CSV: %s", csv_filename)
             return csv_filename
             
         except Exception as e:
-            self.logger.error(f"Failed to save CSV data: {e}")
+            self.logger.error("Failed to save CSV data: %s", e)
             return None
     
-    def check_for_changes(self, new_data: Dict[str, Any]) -> bool:
-        """Check if online count has changed since last fetch"""
-        csv_filename = f"{self.data_dir}/reddit_online_count.csv"
+    @staticmethod
+    def _to_count(value: Any) -> Optional[int]:
+        """Normalize a stored online count; empty means 0, garbage means unknown"""
+        try:
+            return int(value) if value else 0
+        except (ValueError, TypeError):
+            return None
+    
+    def _load_last_saved_count(self) -> Optional[int]:
+        """Read the online count of the last record in the CSV file"""
+        csv_filename = self._csv_path
         
         if not os.path.exists(csv_filename):
-            return True
+            return None
         
         try:
-            with open(csv_filename, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-                
-                if not rows:
-                    return True
-                
-                last_row = rows[-1]
-                old_online_count = last_row.get('online_count')
-                new_online_count = new_data.get('online_count')
-                
-                try:
-                    old_count = int(old_online_count) if old_online_count else 0
-                    new_count = int(new_online_count) if new_online_count else 0
-                    
-                    change = abs(new_count - old_count)
-                    if change > 0:
-                        self.logger.info(f"Online count changed: {old_count} → {new_count} (Δ{new_count-old_count:+d})")
-                        return True
-                    else:
-                        self.logger.info(f"Online count unchanged: {new_count}")
-                        return False
-                        
-                except ValueError:
-                    return True
-                
+            with open(csv_filename, 'rb') as f:
+                header = f.readline()
+                end = f.seek(0, os.SEEK_END)
+                # Only the last record matters, so read a tail block instead of the whole history
+                start = max(len(header), end - self.CSV_TAIL_BYTES)
+                f.seek(start)
+                tail = f.read()
         except Exception as e:
-            self.logger.error(f"Error checking for changes: {e}")
+            self.logger.error("Error checking for changes: %s", e)
+            return None
+        
+        if not header:
+            return None
+        
+        lines = tail.decode('utf-8', errors='replace').splitlines()
+        if start > len(header):
+            # The block may begin part-way through a record
+            lines = lines[1:]
+        
+        fieldnames = next(csv.reader([header.decode('utf-8', errors='replace')]))
+        rows = list(csv.DictReader(lines, fieldnames=fieldnames))
+        if not rows:
+            return None
+        
+        return self._to_count(rows[-1].get('online_count'))
+    
+    def check_for_changes(self, new_data: Dict[str, Any]) -> bool:
+        """Check if online count has changed since last fetch"""
+        # Only the first check reads the CSV; afterwards save_data_to_csv keeps this current
+        if not self._last_saved_loaded:
+            self._last_saved_count = self._load_last_saved_count()
+            self._last_saved_loaded = True
+        
+        old_count = self._last_saved_count
+        if old_count is None:
+            return True
+        
+        new_count = self._to_count(new_data.get('online_count'))
+        if new_count is None:
+            return True
+        
+        change = abs(new_count - old_count)
+        if change > 0:
+            self.logger.info("Online count changed: %d → %d (Δ%+d)", old_count, new_count, new_count - old_count)
             return True
+        else:
+            self.logger.info("Online count unchanged: %d", new_count)
+            return False
     
     def monitor_once(self) -> bool:
         """Perform one monitoring cycle"""
@@ -289,6 +423,9 @@ class RedditMonitor:
         try:
             self.logger.info("Starting monitoring cycle...")
             
+            # Persist deferred counters first, in case the process is killed mid-fetch
+            self.config_manager.flush()
+            
             data = self.fetch_reddit_online_count()
             if not data or not data.get('success'):
                 self.logger.warning("Failed to fetch Reddit data")
@@ -306,7 +443,7 @@ class RedditMonitor:
                 online_count = data.get('online_count', 'N/A')
                 member_count = data.get('member_count', 'N/A')
                 subreddit = data.get('subreddit', 'unknown')
-                self.logger.info(f"r/{subreddit}: {online_count} online, {member_count} members")
+                self.logger.info("r/%s: %s online, %s members", subreddit, online_count, member_count)
                 success = True
             else:
                 self.logger.error("Failed to save data")
@@ -315,12 +452,12 @@ class RedditMonitor:
             self.config_manager.update_check_time(success=success)
             
             stats = self.config_manager.get_session_stats()
-            self.logger.info(f"Total checks: {stats['total_checks']}, Success rate: {stats['success_rate']:.1f}%")
+            self.logger.info("Total checks: %d, Success rate: %.1f%%", stats['total_checks'], stats['success_rate'])
             
             return success
             
         except Exception as e:
-            self.logger.error(f"Error in monitoring cycle: {e}")
+            self.logger.error("Error in monitoring cycle: %s", e)
             self.config_manager.update_check_time(success=False)
             return False
     
@@ -328,44 +465,47 @@ class RedditMonitor:
         """Start continuous monitoring with intelligent scheduling"""
         self.config_manager.start_session()
         
-        self.logger.info(f"Starting Reddit monitor for {self.url}")
-        self.logger.info(f"Monitoring interval: {self.interval} seconds")
+        self.logger.info("Starting Reddit monitor for %s", self.url)
+        self.logger.info("Monitoring interval: %s seconds", self.interval)
         
         last_check = self.config_manager.get_last_check_time()
         if last_check:
-            self.logger.info(f"Resuming from last check: {last_check}")
+            self.logger.info("Resuming from last check: %s", last_check)
             time_until_next = self.config_manager.get_time_until_next_check()
             if time_until_next > 0 and time_until_next < self.interval:
-                self.logger.info(f"Waiting {time_until_next} seconds to resume schedule...")
-                time.sleep(time_until_next)
+                self.logger.info("Waiting %s seconds to resume schedule...", time_until_next)
+                self._stop_event.wait(time_until_next)
         else:
             self.logger.info("Starting fresh monitoring session")
         
         try:
-            while True:
-                if self.config_manager.should_check_now():
-                    self.monitor_once()
+            while not self._stop_event.is_set():
+                if not self.config_manager.should_check_now():
+                    # Sleep straight to the scheduled check; stop() cuts the wait short
+                    self._stop_event.wait(max(1, self.config_manager.get_time_until_next_check()))
+                    continue
+                
+                self.monitor_once()
+                
+                wait_time = self.config_manager.get_time_until_next_check()
+                if wait_time <= 0:
+                    wait_time = self.interval
                     
-                    wait_time = self.config_manager.get_time_until_next_check()
-                    if wait_time <= 0:
-                        wait_time = self.interval
-                        
-                    self.logger.info(f"Next check scheduled in {wait_time} seconds")
-                    time.sleep(wait_time)
-                else:
-                    time.sleep(10)
+                self.logger.info("Next check scheduled in %s seconds", wait_time)
+                self._stop_event.wait(wait_time)
                     
         except KeyboardInterrupt:
             self.logger.info("Monitoring stopped by user")
         except Exception as e:
-            self.logger.error(f"Monitoring error: {e}")
+            self.logger.error("Monitoring error: %s", e)
         finally:
+            self.close()
             self.config_manager.end_session()
             final_stats = self.config_manager.get_session_stats()
             self.logger.info("Session completed:")
-            self.logger.info(f"  Session checks: {final_stats['session_checks']}")
-            self.logger.info(f"  Total checks: {final_stats['total_checks']}")
-            self.logger.info(f"  Success rate: {final_stats['success_rate']:.1f}%")
+            self.logger.info("  Session checks: %s", final_stats['session_checks'])
+            self.logger.info("  Total checks: %s", final_stats['total_checks'])
+            self.logger.info("  Success rate: %.1f%%", final_stats['success_rate'])
     
     def get_status(self) -> Dict[str, Any]:
         """Get current monitoring status"""
@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.core.config_manager import ConfigManager
 from src.core.reddit_monitor import RedditMonitor
-from src.core.data_analyzer import DataAnalyzer
+from src.core.data_analyzer import DataAnalyzer, load_monitoring_csv
 from src.ui.components.dashboard import (
     display_metrics_cards, display_subreddit_info, display_statistics_summary,
     display_activity_status, display_recent_activity, create_data_quality_indicator,
@@ -76,18 +76,14 @@ class RedditMonitorApp:
         return self._config_manager_instance
     
     def load_monitoring_data(self) -> Optional[pd.DataFrame]:
-        """Load monitoring data without caching to avoid hash issues"""
+        """Load monitoring data (parsed once per file version, no Streamlit hashing)"""
         csv_file = f"{self.config_manager.get_data_directory()}/reddit_online_count.csv"
         
         if not os.path.exists(csv_file):
             return pd.DataFrame()
         
         try:
-            df = pd.read_csv(csv_file)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df['online_count'] = pd.to_numeric(df['online_count'], errors='coerce')
-            df['member_count'] = pd.to_numeric(df['member_count'], errors='coerce')
-            return df.dropna(subset=['online_count'])
+            return load_monitoring_csv(csv_file)
         except Exception as e:
             st.error(f"读取数据失败: {e}")
             return pd.DataFrame()
@@ -107,12 +103,13 @@ class RedditMonitorApp:
                     st.error("后台监控脚本不存在，请先创建脚本文件")
                     return False
                 
+                # Output is never read here (the monitor logs to logs/), so discard it
+                # instead of piping it and letting a full pipe buffer stall the child
                 process = subprocess.Popen([
                     sys.executable, script_path
-                ], 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                text=True
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
                 )
                 
                 st.session_state.monitor_process = process
@@ -161,6 +158,7 @@ class RedditMonitorApp:
                 )
                 
                 success = monitor.monitor_once()
+                monitor.close()
                 
                 if success:
                     st.success("✅ 检查完成！数据已更新")
@@ -408,16 +406,15 @@ class RedditMonitorApp:
         # System status
         display_system_status(self.config_manager, monitoring_enabled)
         
+        # Load data once and share it between the anomaly check and the dashboard
+        df = self.load_monitoring_data()
+        
         # Check for data anomalies
-        df_for_anomaly_check = self.load_monitoring_data()
-        check_data_anomalies(df_for_anomaly_check)
+        check_data_anomalies(df)
         
         # Data management
         data_controls = display_data_management_controls(self.config_manager)
         
-        # Load and display data
-        df = self.load_monitoring_data()
-        
         # Handle data export
         if data_controls['export_csv']:
             self.handle_data_export('csv', df)
@@ -303,7 +303,7 @@ def create_config_backup(config_manager) -> str:
     from datetime import datetime
     
     try:
-        config = config_manager.get_config()
+        config = config_manager.clone_config()
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_file = f"config/backup_{timestamp}.json"
         
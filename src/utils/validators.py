@@ -1,5 +1,6 @@
 import re
-from typing import List, Tuple, Optional
+from types import MappingProxyType
+from typing import List, Mapping, Tuple, Optional
 from urllib.parse import urlparse
 
 class URLValidator:
@@ -118,37 +119,40 @@ class ConfigValidator:
         
         return errors
 
-def get_suggested_reddit_urls() -> List[dict]:
+# Read-only so the shared entries can be handed out without copying
+_SUGGESTED_REDDIT_URLS = tuple(MappingProxyType(item) for item in [
+    {
+        "name": "r/Python",
+        "url": "https://www.reddit.com/r/Python/",
+        "description": "Python programming language community"
+    },
+    {
+        "name": "r/programming",
+        "url": "https://www.reddit.com/r/programming/",
+        "description": "Programming discussions and news"
+    },
+    {
+        "name": "r/technology",
+        "url": "https://www.reddit.com/r/technology/",
+        "description": "Technology news and discussions"
+    },
+    {
+        "name": "r/datascience",
+        "url": "https://www.reddit.com/r/datascience/",
+        "description": "Data science community"
+    },
+    {
+        "name": "r/MachineLearning",
+        "url": "https://www.reddit.com/r/MachineLearning/",
+        "description": "Machine learning research and applications"
+    },
+    {
+        "name": "r/webdev",
+        "url": "https://www.reddit.com/r/webdev/",
+        "description": "Web development community"
+    }
+])
+
+def get_suggested_reddit_urls() -> Tuple[Mapping[str, str], ...]:
     """Get a list of suggested Reddit URLs for common subreddits"""
-    return [
-        {
-            "name": "r/Python",
-            "url": "https://www.reddit.com/r/Python/",
-            "description": "Python programming language community"
-        },
-        {
-            "name": "r/programming",
-            "url": "https://www.reddit.com/r/programming/",
-            "description": "Programming discussions and news"
-        },
-        {
-            "name": "r/technology",
-            "url": "https://www.reddit.com/r/technology/",
-            "description": "Technology news and discussions"
-        },
-        {
-            "name": "r/datascience",
-            "url": "https://www.reddit.com/r/datascience/",
-            "description": "Data science community"
-        },
-        {
-            "name": "r/MachineLearning",
-            "url": "https://www.reddit.com/r/MachineLearning/",
-            "description": "Machine learning research and applications"
-        },
-        {
-            "name": "r/webdev",
-            "url": "https://www.reddit.com/r/webdev/",
-            "description": "Web development community"
-        }
-    ]
\ No newline at end of file
+    return _SUGGESTED_REDDIT_URLS